@@ -0,0 +1,171 @@
+"""SQLite storage for healthy component pin voltages.
+
+Each component is one row: the name plus a JSON array of its pin
+voltages in pin order. A save or load touches a single row regardless
+of pin count, and the name primary key doubles as the index for the
+prefix search.
+"""
+
+import json
+import sqlite3
+
+# Identical SQL strings per statement so sqlite3's statement cache hits.
+SQL_DELETE = "DELETE FROM components WHERE name=?"
+SQL_INSERT = "INSERT OR REPLACE INTO components(name, voltages) VALUES(?, ?)"
+SQL_GET_DATA = "SELECT voltages FROM components WHERE name=?"
+SQL_GET_SIMILAR = (
+    "SELECT name FROM components "
+    "WHERE name >= ? AND name < ? ORDER BY name LIMIT 20"
+)
+SQL_GET_MISMATCHES = (
+    "WITH cand(pin, v) AS (VALUES {placeholders}) "
+    "SELECT cand.pin FROM cand "
+    "JOIN components AS c JOIN json_each(c.voltages) AS je "
+    "ON je.key + 1 = cand.pin "
+    "WHERE c.name=? AND (cand.v IS NULL OR abs(je.value - cand.v) > ?)"
+)
+
+
+class ComponentDB:
+    """Manages one or more component databases, one active at a time."""
+
+    def __init__(self, db_path="default.db"):
+        self.connections = {}
+        self.active_db = db_path
+        self._cursor = None
+        self._cache = {}  # (db_path, name) -> (pins, voltages)
+
+    def connect(self, db_path):
+        """Make db_path the active database, closing the previous handle.
+
+        The file itself is only opened on the first actual query, so
+        importing another database right after startup never touches the
+        default file.
+        """
+        if db_path != self.active_db:
+            old = self.connections.pop(self.active_db, None)
+            if old is not None:
+                old.close()
+            self._cursor = None
+        self.active_db = db_path
+
+    @property
+    def conn(self):
+        """The active connection, opened on first use."""
+        conn = self.connections.get(self.active_db)
+        if conn is None:
+            conn = sqlite3.connect(self.active_db)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_table(conn)
+            self.connections[self.active_db] = conn
+            self._cursor = conn.cursor()
+        return conn
+
+    @property
+    def cursor(self):
+        self.conn  # make sure the active connection is open
+        return self._cursor
+
+    def _create_table(self, conn):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS components ("
+            "name TEXT PRIMARY KEY, voltages TEXT)"
+        )
+        conn.commit()
+
+    def insert_component(self, name, voltages):
+        """Save (or replace) the healthy voltages for a component.
+
+        One row per component, so a save is a single INSERT OR REPLACE
+        and one commit regardless of pin count.
+        """
+        with self.conn:
+            self.cursor.execute(
+                SQL_INSERT, (name, json.dumps(voltages, allow_nan=False))
+            )
+        self._cache.pop((self.active_db, name), None)
+
+    def bulk_insert_components(self, items):
+        """Save (or replace) many components in one transaction.
+
+        items is an iterable of (name, voltages) pairs. The whole batch
+        goes through one executemany under a single commit, so importing
+        thousands of components costs one fsync instead of one per
+        component.
+        """
+        items = list(items)
+        with self.conn:
+            self.cursor.executemany(
+                SQL_INSERT,
+                [
+                    (name, json.dumps(voltages, allow_nan=False))
+                    for name, voltages in items
+                ],
+            )
+        for name, _ in items:
+            self._cache.pop((self.active_db, name), None)
+
+    def get_component_data(self, name):
+        """Return the saved pins and voltages as two parallel lists.
+
+        The structure-of-arrays shape lets callers hand the voltages
+        straight to NumPy without repacking row tuples. Results are
+        cached per (database, name) so repeated test clicks on the same
+        component skip the round-trip; writes invalidate the entry.
+        """
+        key = (self.active_db, name)
+        data = self._cache.get(key)
+        if data is None:
+            self.cursor.execute(SQL_GET_DATA, (name,))
+            row = self.cursor.fetchone()
+            voltages = json.loads(row[0]) if row else []
+            data = list(range(1, len(voltages) + 1)), voltages
+            self._cache[key] = data
+        return data
+
+    def get_mismatches(self, name, voltages, tolerance):
+        """Return the pins whose saved voltage is off by more than tolerance.
+
+        voltages is the measured value for pin 1..N in order. The
+        comparison runs inside SQLite, expanding the stored JSON array
+        with json_each against a VALUES CTE of the measured values, so
+        only the (usually small) mismatch set crosses back into Python.
+        A non-finite measurement binds as SQL NULL; the predicate treats
+        that as a mismatch rather than letting it pass silently.
+        """
+        if not voltages:
+            return []
+        placeholders = ", ".join(["(?, ?)"] * len(voltages))
+        sql = SQL_GET_MISMATCHES.format(placeholders=placeholders)
+        params = [x for pair in enumerate(voltages, 1) for x in pair]
+        params += [name, tolerance]
+        self.cursor.execute(sql, params)
+        return [row[0] for row in self.cursor.fetchall()]
+
+    def get_similar_names(self, prefix):
+        """Return up to 20 saved component names starting with prefix.
+
+        Uses a half-open range on name instead of LIKE so the query is a
+        seek on the primary key rather than a full scan.
+        """
+        if not prefix:
+            return []
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        self.cursor.execute(SQL_GET_SIMILAR, (prefix, upper))
+        return [row[0] for row in self.cursor.fetchall()]
+
+    def delete_component(self, name):
+        with self.conn:
+            self.cursor.execute(SQL_DELETE, (name,))
+        self._cache.pop((self.active_db, name), None)
+
+    def import_database(self, db_path):
+        """Switch to another database file, opening it if needed."""
+        self.connect(db_path)
+
+    def close(self):
+        for conn in self.connections.values():
+            conn.close()
+        self.connections.clear()
+        self._cursor = None
@@ -0,0 +1,221 @@
+"""NDMREP - compare measured component pin voltages against saved references."""
+
+import math
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+
+from component_db import ComponentDB
+
+TOLERANCE = 0.05
+MAX_PINS = 16
+
+
+class NDMREPApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("NDMREP")
+        self.db = ComponentDB()
+        self.pin_entries = []
+        self._search_after_id = None
+        self._current_suggestions = []
+        self._results = []  # mirrors the tree rows for cheap export
+        self._build_widgets()
+
+    def _build_widgets(self):
+        top = tk.Frame(self.root)
+        top.pack(fill="x", padx=5, pady=5)
+
+        tk.Label(top, text="Component:").grid(row=0, column=0, sticky="w")
+        self.name_entry = tk.Entry(top, width=30)
+        self.name_entry.grid(row=0, column=1, sticky="w")
+        self.name_entry.bind("<KeyRelease>", self.search_component_names)
+
+        tk.Label(top, text="Pins:").grid(row=0, column=2, sticky="w", padx=(10, 0))
+        self.pin_count = tk.Spinbox(
+            top, from_=1, to=MAX_PINS, width=4, command=self.build_pin_entries
+        )
+        self.pin_count.grid(row=0, column=3, sticky="w")
+
+        self.suggestion_box = tk.Listbox(top, height=5)
+        self.suggestion_box.grid(row=1, column=1, sticky="we")
+        self.suggestion_box.bind("<<ListboxSelect>>", self.load_selected_component)
+
+        self.pin_frame = tk.Frame(self.root)
+        self.pin_frame.pack(fill="x", padx=5)
+        self.build_pin_entries()
+
+        buttons = tk.Frame(self.root)
+        buttons.pack(fill="x", padx=5, pady=5)
+        tk.Button(buttons, text="Save Healthy", command=self.save_healthy).pack(
+            side="left"
+        )
+        tk.Button(buttons, text="Test", command=self.test_component).pack(side="left")
+        tk.Button(buttons, text="Delete", command=self.delete_component).pack(
+            side="left"
+        )
+        tk.Button(buttons, text="Import DB", command=self.import_database).pack(
+            side="left"
+        )
+        tk.Button(buttons, text="Export Results", command=self.export_results).pack(
+            side="left"
+        )
+
+        columns = ("pin", "expected", "measured", "status")
+        self.tree = ttk.Treeview(self.root, columns=columns, show="headings")
+        for col in columns:
+            self.tree.heading(col, text=col.capitalize())
+            self.tree.column(col, width=90, anchor="center")
+        self.tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def build_pin_entries(self):
+        for widget in self.pin_frame.winfo_children():
+            widget.destroy()
+        self.pin_entries = []
+        count = int(self.pin_count.get())
+        for i in range(count):
+            tk.Label(self.pin_frame, text=f"Pin {i + 1}").grid(row=0, column=i)
+            entry = tk.Entry(self.pin_frame, width=6)
+            entry.grid(row=1, column=i, padx=2)
+            self.pin_entries.append(entry)
+
+    def search_component_names(self, event=None):
+        # Debounce so fast typing issues one query instead of one per key.
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(200, self._do_search)
+
+    def _do_search(self):
+        self._search_after_id = None
+        prefix = self.name_entry.get().strip()
+        names = self.db.get_similar_names(prefix) if prefix else []
+        # Rewrite only the tail that changed instead of rebuilding the
+        # whole listbox; extending a prefix usually just shrinks the list.
+        current = self._current_suggestions
+        keep = 0
+        for old, new in zip(current, names):
+            if old != new:
+                break
+            keep += 1
+        if keep < len(current):
+            self.suggestion_box.delete(keep, tk.END)
+        for name in names[keep:]:
+            self.suggestion_box.insert(tk.END, name)
+        self._current_suggestions = names
+
+    def load_selected_component(self, event=None):
+        selection = self.suggestion_box.curselection()
+        if not selection:
+            return
+        name = self.suggestion_box.get(selection[0])
+        pins, voltages = self.db.get_component_data(name)
+        if not pins:
+            return
+        self.name_entry.delete(0, tk.END)
+        self.name_entry.insert(0, name)
+        self.pin_count.delete(0, tk.END)
+        self.pin_count.insert(0, len(pins))
+        self.build_pin_entries()
+        for entry, voltage in zip(self.pin_entries, voltages):
+            entry.insert(0, voltage)
+
+    def _read_voltages(self):
+        """Read every pin entry in one pass; raises ValueError on bad input.
+
+        Values are kept as entered; rounding is a display concern and
+        happens when rows are rendered. Non-finite values (nan/inf)
+        parse as floats but cannot be stored as JSON, so they are
+        rejected here like any other bad input.
+        """
+        f = float
+        values = [f(e.get()) for e in self.pin_entries]
+        if not all(map(math.isfinite, values)):
+            raise ValueError("voltages must be finite")
+        return values
+
+    def save_healthy(self):
+        name = self.name_entry.get().strip()
+        if not name:
+            messagebox.showwarning("NDMREP", "Enter a component name.")
+            return
+        try:
+            voltages = self._read_voltages()
+        except ValueError:
+            messagebox.showerror("NDMREP", "All pin voltages must be numbers.")
+            return
+        self.db.insert_component(name, voltages)
+        messagebox.showinfo("NDMREP", f"Saved {name} ({len(voltages)} pins).")
+
+    def test_component(self):
+        name = self.name_entry.get().strip()
+        pins, reference = self.db.get_component_data(name)
+        if not pins:
+            messagebox.showwarning("NDMREP", f"No saved data for {name!r}.")
+            return
+        try:
+            measured = self._read_voltages()
+        except ValueError:
+            messagebox.showerror("NDMREP", "All pin voltages must be numbers.")
+            return
+        if len(measured) != len(pins):
+            messagebox.showwarning(
+                "NDMREP",
+                f"{name} has {len(pins)} pins saved, got {len(measured)}.",
+            )
+            return
+        failed = set(self.db.get_mismatches(name, measured, TOLERANCE))
+        matched = len(pins) - len(failed)
+        rows = [
+            (pin, f"{reference[i]:.2f}", f"{measured[i]:.2f}",
+             "FAIL" if pin in failed else "OK")
+            for i, pin in enumerate(pins)
+        ]
+        # Touch the widget only after the compute phase, in one batch.
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            self.tree.insert("", "end", values=row)
+        self._results = rows
+        messagebox.showinfo(
+            "NDMREP", f"{name}: {matched}/{len(measured)} pins within tolerance."
+        )
+
+    def delete_component(self):
+        name = self.name_entry.get().strip()
+        if not name:
+            return
+        if messagebox.askyesno("NDMREP", f"Delete {name}?"):
+            self.db.delete_component(name)
+            self.search_component_names()
+
+    def import_database(self):
+        path = filedialog.askopenfilename(
+            filetypes=[("SQLite databases", "*.db"), ("All files", "*.*")]
+        )
+        if path:
+            self.db.import_database(path)
+            self.search_component_names()
+
+    def export_results(self):
+        if not self._results:
+            messagebox.showwarning("NDMREP", "Nothing to export.")
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".txt", filetypes=[("Text files", "*.txt")]
+        )
+        if not path:
+            return
+        lines = [", ".join(map(str, row)) for row in self._results]
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        self.tree.delete(*self.tree.get_children())
+        self._results = []
+        messagebox.showinfo("NDMREP", f"Results exported to {path}.")
+
+
+def main():
+    root = tk.Tk()
+    app = NDMREPApp(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()